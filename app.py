@@ -4,14 +4,22 @@ Stock Historical Data Viewer - Streamlit Web App
 An interactive web application to view historical stock pricing data using yfinance and Plotly.
 """
 
+import os
+import time
+from functools import lru_cache
+
 import streamlit as st
-import yfinance as yf
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from pathlib import Path
 import pandas as pd
 import numpy as np
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:  # numba is optional; fall back to pandas implementations
+    HAS_NUMBA = False
+
 # Page configuration
 st.set_page_config(
     page_title="Stock Historical Data Viewer",
@@ -54,7 +62,10 @@ preset_choice = st.sidebar.selectbox(
     index=1  # Default to "Last Month"
 )
 
-end_date = datetime.now()
+# Midnight of today rather than datetime.now(): a microsecond-precision end
+# date would give every rerun a fresh fetch_stock_data cache key and bust
+# the cache within the trading day
+end_date = datetime.combine(date.today(), datetime.min.time())
 start_date = end_date - timedelta(days=30)  # Default
 
 # Calculate dates based on preset
@@ -73,7 +84,7 @@ elif preset_choice == "Custom":
         end_date_input = st.date_input(
             "End Date",
             value=end_date,
-            max_value=datetime.now()
+            max_value=end_date
         )
         end_date = datetime.combine(end_date_input, datetime.min.time())
 else:
@@ -212,26 +223,173 @@ if st.sidebar.button("➕ Add Feature"):
         st.sidebar.warning("Please select a feature type")
 
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
-def fetch_stock_data(symbol, start_date, end_date, interval="1d"):
-    """Fetch historical stock data using yfinance."""
+# On-disk history cache: one parquet file per symbol/interval holding the
+# widest window fetched so far, so repeat requests become dataframe slices
+# instead of network round-trips.
+CACHE_DIR = Path('.cache')
+
+# Cache freshness per interval, aligned to how often the underlying data can
+# actually change: there is no point re-asking Yahoo for weekly bars every
+# five minutes
+_CACHE_TTL = {'1h': 300, '4h': 900, '1d': 86400, '1wk': 604800}
+
+# Reuse yf.Ticker objects across fetches (they carry session/cookie state)
+_ticker_pool = {}
+
+
+def _get_ticker(symbol):
+    """Return a pooled yf.Ticker for the symbol, creating it on first use."""
+    import yfinance as yf
+
+    if symbol not in _ticker_pool:
+        _ticker_pool[symbol] = yf.Ticker(symbol)
+    return _ticker_pool[symbol]
+
+
+def _cache_path(symbol, interval):
+    return CACHE_DIR / f"{symbol}_{interval}.parquet"
+
+
+def _naive_index(data):
+    """Return the index as timezone-naive timestamps for range comparisons."""
+    index = data.index
+    return index.tz_localize(None) if index.tz is not None else index
+
+
+def _cache_is_fresh(symbol, interval):
+    """True if the cache file is younger than the interval's data cadence."""
     try:
-        ticker = yf.Ticker(symbol)
-        data = ticker.history(
-            start=start_date.strftime("%Y-%m-%d"),
-            end=end_date.strftime("%Y-%m-%d"),
-            interval=interval
-        )
+        age = time.time() - os.path.getmtime(_cache_path(symbol, interval))
+    except OSError:
+        return False
+    return age < _CACHE_TTL.get(interval, 300)
+
+
+def _load_history_cache(symbol, interval):
+    """Load the cached history for a symbol/interval, or None if unavailable."""
+    path = _cache_path(symbol, interval)
+    if not path.exists():
+        return None
+    try:
+        return pd.read_parquet(path)
+    except Exception:
+        return None
 
-        if data.empty:
-            return None
 
+def _store_history_cache(symbol, interval, data):
+    """Write history back to the on-disk cache (best-effort)."""
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        data.to_parquet(_cache_path(symbol, interval), compression='zstd')
+    except Exception:
+        # Fetching still works without the cache
+        pass
+
+
+def _download_history(symbol, start_date, end_date, interval):
+    """Download [start_date, end_date] history from Yahoo Finance (OHLCV only)."""
+    ticker = _get_ticker(symbol)
+    data = ticker.history(
+        start=start_date.strftime("%Y-%m-%d"),
+        end=end_date.strftime("%Y-%m-%d"),
+        interval=interval
+    )
+    # history() also returns Dividends/Stock Splits columns nothing here
+    # uses; drop them before they enter the caches
+    keep = [c for c in ('Open', 'High', 'Low', 'Close', 'Volume') if c in data.columns]
+    return data[keep]
+
+
+def _arrow_backed(data):
+    """Convert the frame to Arrow-backed dtypes so Streamlit's Arrow
+    serialization for the browser is a straight handoff instead of a
+    NumPy-to-Arrow conversion; no-op when pyarrow is unavailable."""
+    try:
+        return data.convert_dtypes(dtype_backend='pyarrow')
+    except ImportError:
         return data
+
+
+@st.cache_resource(ttl=300)  # Cache for 5 minutes; callers copy the frame
+def fetch_stock_data(symbol, start_date, end_date, interval="1d"):
+    """Fetch historical stock data, slicing the on-disk cache when it already
+    covers the requested window and downloading only the missing tail when it
+    doesn't."""
+    try:
+        start = pd.Timestamp(start_date)
+        end = pd.Timestamp(end_date)
+
+        cached = _load_history_cache(symbol, interval)
+        if cached is None or cached.empty:
+            data = _download_history(symbol, start_date, end_date, interval)
+            if data.empty:
+                return None
+            _store_history_cache(symbol, interval, data)
+            return _arrow_backed(data)
+
+        # Download only the parts of the window the cache doesn't cover yet
+        changed = False
+        index = _naive_index(cached)
+        if index[0] > start:
+            head = _download_history(symbol, start_date, index[0], interval)
+            if not head.empty:
+                cached = pd.concat([head, cached])
+                changed = True
+                index = _naive_index(cached)
+        if index[-1] < end and not _cache_is_fresh(symbol, interval):
+            tail = _download_history(symbol, index[-1], end_date, interval)
+            if not tail.empty:
+                cached = pd.concat([cached, tail])
+                changed = True
+
+        if changed:
+            cached = cached[~cached.index.duplicated(keep='last')].sort_index()
+            _store_history_cache(symbol, interval, cached)
+
+        index = _naive_index(cached)
+        data = cached.loc[(index >= start) & (index <= end)]
+        return _arrow_backed(data.copy()) if not data.empty else None
     except Exception as e:
         st.error(f"Error fetching data: {e}")
         return None
 
 
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _sma_kernel(close, period):
+        """O(N) rolling mean: add the incoming value, subtract the outgoing
+        one, instead of re-summing each window."""
+        n = close.shape[0]
+        out = np.empty(n)
+        out[:] = np.nan
+        if n < period:
+            return out
+        total = 0.0
+        for i in range(period):
+            total += close[i]
+        out[period - 1] = total / period
+        for i in range(period, n):
+            total += close[i] - close[i - period]
+            out[i] = total / period
+        return out
+
+
+@lru_cache(maxsize=64)
+def _wma_weights(period):
+    """Normalized linear WMA weights, pre-reversed for np.convolve."""
+    weights = np.arange(1, period + 1, dtype=np.float64)
+    return (weights / weights.sum())[::-1].copy()
+
+
+def _simple_moving_average(data, period):
+    """Simple moving average via the running-sum kernel when numba is
+    available, pandas rolling mean otherwise."""
+    if HAS_NUMBA:
+        values = _sma_kernel(data['Close'].to_numpy(dtype=np.float64), period)
+        return pd.Series(values, index=data.index)
+    return data['Close'].rolling(window=period).mean()
+
+
 def calculate_moving_average(data, period, ma_type='SMA'):
     """
     Calculate moving average.
@@ -246,19 +404,46 @@ def calculate_moving_average(data, period, ma_type='SMA'):
     """
     if ma_type == 'SMA':
         # Simple Moving Average
-        return data['Close'].rolling(window=period).mean()
+        return _simple_moving_average(data, period)
     elif ma_type == 'EMA':
         # Exponential Moving Average (more weight to recent prices)
         return data['Close'].ewm(span=period, adjust=False).mean()
     elif ma_type == 'WMA':
-        # Weighted Moving Average (linear weights)
-        weights = np.arange(1, period + 1)
-        return data['Close'].rolling(window=period).apply(
-            lambda prices: np.dot(prices, weights) / weights.sum(), raw=True
-        )
+        # Weighted Moving Average (linear weights) as a single FIR
+        # convolution instead of a Python lambda per window
+        weights = _wma_weights(period)
+        close = data['Close'].to_numpy(dtype=np.float64)
+        out = np.full(close.shape, np.nan)
+        if close.size >= period:
+            out[period - 1:] = np.convolve(close, weights, mode='valid')
+        return pd.Series(out, index=data.index)
     else:
         # Default to SMA
-        return data['Close'].rolling(window=period).mean()
+        return _simple_moving_average(data, period)
+
+
+if HAS_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def _rsi_kernel(close, period):
+        """Single-pass Wilder RSI: gains, losses and both smoothed averages
+        are updated in one traversal instead of separate ewm passes."""
+        n = close.shape[0]
+        out = np.empty(n)
+        out[:] = np.nan
+        alpha = 1.0 / period
+        avg_gain = 0.0
+        avg_loss = 0.0
+        for i in range(1, n):
+            delta = close[i] - close[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            avg_gain = alpha * gain + (1.0 - alpha) * avg_gain
+            avg_loss = alpha * loss + (1.0 - alpha) * avg_loss
+            if avg_loss > 0:
+                out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+            elif avg_gain > 0:
+                out[i] = 100.0
+        return out
 
 
 def calculate_rsi(data, period=14):
@@ -272,53 +457,199 @@ def calculate_rsi(data, period=14):
     Returns:
         Pandas Series with RSI values (0-100)
     """
-    # Calculate price changes
-    delta = data['Close'].diff()
+    if HAS_NUMBA:
+        values = _rsi_kernel(data['Close'].to_numpy(dtype=np.float64), period)
+        return pd.Series(values, index=data.index)
+
+    # Fallback without numba: build the gain/loss arrays in vectorized NumPy
+    # and fuse the closing arithmetic, leaving only the two Wilder smoothing
+    # passes in pandas ewm
+    close = data['Close'].to_numpy(dtype=np.float64)
+    delta = np.diff(close, prepend=close[:1])
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+
+    avg_gain = pd.Series(gain, index=data.index).ewm(com=period - 1, adjust=False).mean().to_numpy()
+    avg_loss = pd.Series(loss, index=data.index).ewm(com=period - 1, adjust=False).mean().to_numpy()
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    return pd.Series(rsi, index=data.index)
+
+
+def _data_fingerprint(symbol, data):
+    """Cheap identity key for a fetched frame: symbol, endpoints and length.
+
+    Avoids hashing the whole DataFrame when memoizing feature computations.
+    """
+    return (symbol, data.index[0], data.index[-1], len(data))
+
+
+@st.cache_data(ttl=300)
+def _cached_moving_average(fingerprint, period, ma_type, _data):
+    """Memoized moving average; the fingerprint stands in for _data in the
+    cache key so reruns that only change presentation skip recomputation."""
+    return calculate_moving_average(_data, period, ma_type)
+
+
+@st.cache_data(ttl=300)
+def _cached_rsi(fingerprint, period, _data):
+    """Memoized RSI, keyed the same way as _cached_moving_average."""
+    return calculate_rsi(_data, period)
+
+
+# Above this many points, line traces are decimated before being handed to
+# Plotly; the browser renders far fewer nodes with no visible difference at
+# default zoom.
+MAX_TRACE_POINTS = 2000
+
+
+def _lttb_indices(y, n_out):
+    """Pick indices to keep via Largest-Triangle-Three-Buckets downsampling.
+
+    Works on the values only (x is treated as evenly spaced, which holds for
+    bar-interval data). Endpoints are always kept; NaN stretches fall back to
+    the first point of the bucket.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.arange(n, dtype=np.float64)
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0] = 0
+    keep[-1] = n - 1
+
+    # Bucket edges across the interior points [1, n-1)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+
+    anchor = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if hi <= lo:
+            hi = lo + 1
+
+        # Mean of the following bucket is the third triangle vertex
+        nlo = edges[i + 1]
+        nhi = edges[i + 2] if i + 2 <= n_out - 2 else n
+        bucket = y[nlo:nhi]
+        finite = bucket[~np.isnan(bucket)]
+        with np.errstate(invalid='ignore'):
+            avg_x = x[nlo:nhi].mean() if nhi > nlo else x[nlo - 1]
+            avg_y = finite.mean() if finite.size else np.nan
+
+            areas = np.abs(
+                (x[anchor] - avg_x) * (y[lo:hi] - y[anchor])
+                - (x[anchor] - x[lo:hi]) * (y[anchor] - avg_y)
+            )
+        areas = np.where(np.isnan(areas), -1.0, areas)
+        anchor = lo + int(np.argmax(areas))
+        keep[i + 1] = anchor
+
+    return keep
+
+
+def _downsample_trace(x, y, n_out=MAX_TRACE_POINTS):
+    """Return (x, y) decimated with LTTB; no-op for short series."""
+    y_arr = np.asarray(y, dtype=np.float64)
+    if len(y_arr) <= n_out:
+        return x, y
+    idx = _lttb_indices(y_arr, n_out)
+    return x[idx], y_arr[idx]
+
+
+@st.cache_data(ttl=300)
+def _to_csv_bytes(fingerprint, _data):
+    """Memoized CSV serialization of the fetched frame.
+
+    Uses pyarrow's multithreaded CSV writer when available and falls back to
+    pandas; the fingerprint stands in for _data in the cache key so reruns
+    don't re-serialize unchanged data.
+    """
+    try:
+        import io
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+        buf = io.BytesIO()
+        pacsv.write_csv(pa.Table.from_pandas(_data.reset_index()), buf)
+        return buf.getvalue()
+    except ImportError:
+        return _data.to_csv().encode('utf-8')
+
 
-    # Separate gains and losses
-    gain = (delta.where(delta > 0, 0)).fillna(0)
-    loss = (-delta.where(delta < 0, 0)).fillna(0)
+def _feature_key(feature):
+    """Hashable identity of a feature's computation parameters."""
+    return (feature['type'], feature.get('period'), feature.get('ma_type'))
 
-    # Calculate average gain and loss using EMA (Wilder's smoothing)
-    avg_gain = gain.ewm(com=period - 1, adjust=False).mean()
-    avg_loss = loss.ewm(com=period - 1, adjust=False).mean()
 
-    # Calculate RS and RSI
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
+def compute_features(symbol, data, features):
+    """Compute every requested feature once, keyed by _feature_key.
 
-    return rsi
+    Chart builders plot from this dict instead of recomputing, so switching
+    chart types doesn't redo the math.
+    """
+    computed = {}
+    if not features:
+        return computed
+    fingerprint = _data_fingerprint(symbol, data)
+    for feature in features:
+        key = _feature_key(feature)
+        if key in computed:
+            continue
+        if feature['type'] == 'moving_average':
+            computed[key] = _cached_moving_average(
+                fingerprint, feature['period'], feature['ma_type'], data)
+        elif feature['type'] == 'rsi':
+            computed[key] = _cached_rsi(fingerprint, feature['period'], data)
+    return computed
 
 
 def display_summary_stats(symbol, data):
     """Display summary statistics."""
     st.subheader(f"📊 Summary for {symbol}")
 
+    # Pull each column into NumPy once and compute every statistic from
+    # those arrays instead of issuing separate pandas reductions per metric
+    close = data['Close'].to_numpy(dtype=np.float64)
+    volume = data['Volume'].to_numpy(dtype=np.float64)
+    first_open = float(data['Open'].iloc[0])
+    high_max = float(data['High'].to_numpy(dtype=np.float64).max())
+    low_min = float(data['Low'].to_numpy(dtype=np.float64).min())
+    first_close = close[0]
+    last_close = close[-1]
+    close_mean = close.mean()
+    close_std = close.std(ddof=1)
+    vol_mean = volume.mean()
+    vol_sum = volume.sum()
+    price_change = last_close - first_close
+    percent_change = (price_change / first_close) * 100
+
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
         st.metric(
             "Current Price",
-            f"${data['Close'].iloc[-1]:.2f}",
-            f"{((data['Close'].iloc[-1] - data['Close'].iloc[0]) / data['Close'].iloc[0] * 100):+.2f}%"
+            f"${last_close:.2f}",
+            f"{percent_change:+.2f}%"
         )
 
     with col2:
         st.metric(
             "High",
-            f"${data['High'].max():.2f}"
+            f"${high_max:.2f}"
         )
 
     with col3:
         st.metric(
             "Low",
-            f"${data['Low'].min():.2f}"
+            f"${low_min:.2f}"
         )
 
     with col4:
         st.metric(
             "Avg Volume",
-            f"{data['Volume'].mean():,.0f}"
+            f"{vol_mean:,.0f}"
         )
 
     # Additional details in expandable section
@@ -329,361 +660,282 @@ def display_summary_stats(symbol, data):
             st.write("**Price Statistics:**")
             st.write(f"Period: {data.index[0].strftime('%Y-%m-%d')} to {data.index[-1].strftime('%Y-%m-%d')}")
             st.write(f"Trading Days: {len(data)}")
-            st.write(f"Opening Price: ${data['Open'].iloc[0]:.2f}")
-            st.write(f"Closing Price: ${data['Close'].iloc[-1]:.2f}")
-            st.write(f"Average Close: ${data['Close'].mean():.2f}")
+            st.write(f"Opening Price: ${first_open:.2f}")
+            st.write(f"Closing Price: ${last_close:.2f}")
+            st.write(f"Average Close: ${close_mean:.2f}")
 
         with col2:
-            price_change = data['Close'].iloc[-1] - data['Close'].iloc[0]
-            percent_change = (price_change / data['Close'].iloc[0]) * 100
-
             st.write("**Performance:**")
             st.write(f"Price Change: ${price_change:+.2f}")
             st.write(f"Percent Change: {percent_change:+.2f}%")
-            st.write(f"Volatility (Std): ${data['Close'].std():.2f}")
-            st.write(f"Total Volume: {data['Volume'].sum():,.0f}")
+            st.write(f"Volatility (Std): ${close_std:.2f}")
+            st.write(f"Total Volume: {vol_sum:,.0f}")
 
 
-def create_line_chart(symbol, data, interval_label="1 Day", features=None):
-    """Create line chart with Plotly."""
-    # Check if RSI features exist
-    has_rsi = any(f['type'] == 'rsi' for f in features) if features else False
+_FEATURE_COLORS = ['#FF6B35', '#4ECDC4', '#FFE66D', '#FF6B9D']
 
-    if has_rsi:
-        # Create subplots for price + RSI
-        fig = make_subplots(
-            rows=2, cols=1,
-            shared_xaxes=True,
-            vertical_spacing=0.05,
-            row_heights=[0.7, 0.3],
-            subplot_titles=(f'{symbol} - Closing Price ({interval_label})', 'RSI')
-        )
-        price_row = 1
-    else:
-        # Single plot for price only
-        fig = go.Figure()
-        price_row = None
 
-    # Add price trace
-    fig.add_trace(go.Scatter(
-        x=data.index,
-        y=data['Close'],
-        mode='lines',
-        name='Close Price',
-        line=dict(color='#2E86AB', width=2),
-        fill='tozeroy',
-        fillcolor='rgba(162, 59, 114, 0.3)',
-        hovertemplate='<b>Date</b>: %{x|%Y-%m-%d}<br><b>Price</b>: $%{y:.2f}<extra></extra>'
-    ), row=price_row, col=1 if has_rsi else None)
-
-    # Add features
-    if features:
-        colors = ['#FF6B35', '#4ECDC4', '#FFE66D', '#FF6B9D']
-        ma_idx = 0
-        for feature in features:
-            if feature['type'] == 'moving_average':
-                ma = calculate_moving_average(data, feature['period'], feature['ma_type'])
-                color = colors[ma_idx % len(colors)]
-                ma_idx += 1
-                fig.add_trace(go.Scatter(
-                    x=data.index,
-                    y=ma,
-                    mode='lines',
-                    name=f"{feature['ma_type']}-{feature['period']}",
-                    line=dict(color=color, width=2),
-                    hovertemplate=f"<b>{feature['ma_type']}-{feature['period']}</b>: $%{{y:.2f}}<extra></extra>"
-                ), row=price_row, col=1 if has_rsi else None)
-            elif feature['type'] == 'rsi':
-                rsi = calculate_rsi(data, feature['period'])
-                fig.add_trace(go.Scatter(
-                    x=data.index,
-                    y=rsi,
-                    mode='lines',
-                    name=f"RSI-{feature['period']}",
-                    line=dict(color='#9B59B6', width=2),
-                    hovertemplate=f"<b>RSI-{feature['period']}</b>: %{{y:.2f}}<extra></extra>"
-                ), row=2, col=1)
-
-                # Add reference lines at 30 and 70
-                fig.add_hline(y=70, line_dash="dash", line_color="red", opacity=0.5, row=2, col=1)
-                fig.add_hline(y=30, line_dash="dash", line_color="green", opacity=0.5, row=2, col=1)
-
-    # Update layout
-    if has_rsi:
-        fig.update_xaxes(title_text='Date', row=2, col=1)
-        fig.update_yaxes(title_text='Price ($)', row=1, col=1)
-        fig.update_yaxes(title_text='RSI', range=[0, 100], row=2, col=1)
-        fig.update_layout(
-            hovermode='x unified',
-            template='plotly_white',
-            height=700,
-            showlegend=True
-        )
-    else:
-        fig.update_layout(
-            title=f'{symbol} - Closing Price History ({interval_label} Intervals)',
-            xaxis_title='Date',
-            yaxis_title='Price ($)',
-            hovermode='x unified',
-            template='plotly_white',
-            height=600
-        )
-
-    return fig
-
-
-def create_candlestick_chart(symbol, data, interval_label="1 Day", features=None):
-    """Create candlestick chart with Plotly."""
-    # Check if RSI features exist
-    has_rsi = any(f['type'] == 'rsi' for f in features) if features else False
-
-    if has_rsi:
-        # Create subplots for price + RSI
-        fig = make_subplots(
-            rows=2, cols=1,
-            shared_xaxes=True,
-            vertical_spacing=0.05,
-            row_heights=[0.7, 0.3],
-            subplot_titles=(f'{symbol} - Candlestick ({interval_label})', 'RSI')
-        )
-        price_row = 1
-    else:
-        # Single plot for price only
-        fig = go.Figure()
-        price_row = None
-
-    # Add candlestick trace
-    fig.add_trace(go.Candlestick(
-        x=data.index,
-        open=data['Open'],
-        high=data['High'],
-        low=data['Low'],
-        close=data['Close'],
-        name='OHLC',
-        increasing_line_color='#06A77D',
-        decreasing_line_color='#D62828'
-    ), row=price_row, col=1 if has_rsi else None)
-
-    # Add features
-    if features:
-        colors = ['#FF6B35', '#4ECDC4', '#FFE66D', '#FF6B9D']
-        ma_idx = 0
-        for feature in features:
-            if feature['type'] == 'moving_average':
-                ma = calculate_moving_average(data, feature['period'], feature['ma_type'])
-                color = colors[ma_idx % len(colors)]
-                ma_idx += 1
-                fig.add_trace(go.Scatter(
-                    x=data.index,
-                    y=ma,
-                    mode='lines',
-                    name=f"{feature['ma_type']}-{feature['period']}",
-                    line=dict(color=color, width=2),
-                    hovertemplate=f"<b>{feature['ma_type']}-{feature['period']}</b>: $%{{y:.2f}}<extra></extra>"
-                ), row=price_row, col=1 if has_rsi else None)
-            elif feature['type'] == 'rsi':
-                rsi = calculate_rsi(data, feature['period'])
-                fig.add_trace(go.Scatter(
-                    x=data.index,
-                    y=rsi,
-                    mode='lines',
-                    name=f"RSI-{feature['period']}",
-                    line=dict(color='#9B59B6', width=2),
-                    hovertemplate=f"<b>RSI-{feature['period']}</b>: %{{y:.2f}}<extra></extra>"
-                ), row=2, col=1)
-
-                # Add reference lines at 30 and 70
-                fig.add_hline(y=70, line_dash="dash", line_color="red", opacity=0.5, row=2, col=1)
-                fig.add_hline(y=30, line_dash="dash", line_color="green", opacity=0.5, row=2, col=1)
-
-    # Update layout
-    if has_rsi:
-        fig.update_xaxes(title_text='Date', row=2, col=1)
-        fig.update_yaxes(title_text='Price ($)', row=1, col=1)
-        fig.update_yaxes(title_text='RSI', range=[0, 100], row=2, col=1)
-        fig.update_layout(
-            hovermode='x unified',
-            template='plotly_white',
-            height=700,
-            showlegend=True
-        )
-    else:
-        fig.update_layout(
-            title=f'{symbol} - Candlestick Chart ({interval_label} Candles)',
-            xaxis_title='Date',
-            yaxis_title='Price ($)',
-            template='plotly_white',
-            height=600
-        )
-
-    return fig
-
-
-def create_volume_chart(symbol, data, interval_label="1 Day"):
-    """Create volume chart with Plotly."""
-    fig = go.Figure()
-
-    colors = ['#06A77D' if data['Close'].iloc[i] >= data['Open'].iloc[i] else '#D62828'
-              for i in range(len(data))]
-
-    fig.add_trace(go.Bar(
+def _volume_bar_trace(data, with_date=False):
+    """Build the color-coded volume Bar trace shared by chart kinds."""
+    import plotly.graph_objects as go
+    up = data['Close'].to_numpy() >= data['Open'].to_numpy()
+    colors = np.where(up, '#06A77D', '#D62828').tolist()
+    hover = ('<b>Date</b>: %{x|%Y-%m-%d}<br><b>Volume</b>: %{y:,.0f}<extra></extra>'
+             if with_date else '<b>Volume</b>: %{y:,.0f}<extra></extra>')
+    return go.Bar(
         x=data.index,
         y=data['Volume'],
         marker_color=colors,
         opacity=0.7,
         name='Volume',
-        hovertemplate='<b>Date</b>: %{x|%Y-%m-%d}<br><b>Volume</b>: %{y:,.0f}<extra></extra>'
-    ))
-
-    fig.update_layout(
-        title=f'{symbol} - Trading Volume ({interval_label} Bars)',
-        xaxis_title='Date',
-        yaxis_title='Volume',
-        template='plotly_white',
-        height=600
+        hovertemplate=hover
     )
 
-    return fig
 
+def _add_price_traces(fig, chart_kind, data, price_row):
+    """Add the primary price trace(s) for the chart kind to the figure."""
+    import plotly.graph_objects as go
+    col = 1 if price_row else None
+    if chart_kind == 'line':
+        close_x, close_y = _downsample_trace(data.index, data['Close'])
+        fig.add_trace(go.Scattergl(
+            x=close_x,
+            y=close_y,
+            mode='lines',
+            name='Close Price',
+            line=dict(color='#2E86AB', width=2),
+            fill='tozeroy',
+            fillcolor='rgba(162, 59, 114, 0.3)',
+            hovertemplate='<b>Date</b>: %{x|%Y-%m-%d}<br><b>Price</b>: $%{y:.2f}<extra></extra>'
+        ), row=price_row, col=col)
+    elif chart_kind == 'candlestick':
+        fig.add_trace(go.Candlestick(
+            x=data.index,
+            open=data['Open'],
+            high=data['High'],
+            low=data['Low'],
+            close=data['Close'],
+            name='OHLC',
+            increasing_line_color='#06A77D',
+            decreasing_line_color='#D62828'
+        ), row=price_row, col=col)
+    elif chart_kind == 'combined':
+        # High/low band plus close and open lines
+        high_x, high_y = _downsample_trace(data.index, data['High'])
+        fig.add_trace(go.Scattergl(
+            x=high_x,
+            y=high_y,
+            fill=None,
+            mode='lines',
+            line_color='rgba(162, 59, 114, 0)',
+            showlegend=False,
+            hoverinfo='skip'
+        ), row=price_row, col=col)
+
+        low_x, low_y = _downsample_trace(data.index, data['Low'])
+        fig.add_trace(go.Scattergl(
+            x=low_x,
+            y=low_y,
+            fill='tonexty',
+            mode='lines',
+            line_color='rgba(162, 59, 114, 0)',
+            fillcolor='rgba(162, 59, 114, 0.2)',
+            name='High/Low Range',
+            hoverinfo='skip'
+        ), row=price_row, col=col)
+
+        close_x, close_y = _downsample_trace(data.index, data['Close'])
+        fig.add_trace(go.Scattergl(
+            x=close_x,
+            y=close_y,
+            mode='lines',
+            name='Close',
+            line=dict(color='#2E86AB', width=2),
+            hovertemplate='<b>Close</b>: $%{y:.2f}<extra></extra>'
+        ), row=price_row, col=col)
+
+        open_x, open_y = _downsample_trace(data.index, data['Open'])
+        fig.add_trace(go.Scattergl(
+            x=open_x,
+            y=open_y,
+            mode='lines',
+            name='Open',
+            line=dict(color='#F77F00', width=1),
+            opacity=0.7,
+            hovertemplate='<b>Open</b>: $%{y:.2f}<extra></extra>'
+        ), row=price_row, col=col)
+
+
+def _add_features(fig, data, features, computed, price_row, rsi_row):
+    """Overlay MA traces on the price row and RSI traces on their own row."""
+    import plotly.graph_objects as go
+    col = 1 if price_row else None
+    ma_idx = 0
+    for feature in features:
+        if feature['type'] == 'moving_average':
+            ma = computed[_feature_key(feature)]
+            color = _FEATURE_COLORS[ma_idx % len(_FEATURE_COLORS)]
+            ma_idx += 1
+            ma_x, ma_y = _downsample_trace(data.index, ma)
+            fig.add_trace(go.Scattergl(
+                x=ma_x,
+                y=ma_y,
+                mode='lines',
+                name=f"{feature['ma_type']}-{feature['period']}",
+                line=dict(color=color, width=2),
+                hovertemplate=f"<b>{feature['ma_type']}-{feature['period']}</b>: $%{{y:.2f}}<extra></extra>"
+            ), row=price_row, col=col)
+        elif feature['type'] == 'rsi':
+            rsi = computed[_feature_key(feature)]
+            rsi_x, rsi_y = _downsample_trace(data.index, rsi)
+            fig.add_trace(go.Scattergl(
+                x=rsi_x,
+                y=rsi_y,
+                mode='lines',
+                name=f"RSI-{feature['period']}",
+                line=dict(color='#9B59B6', width=2),
+                hovertemplate=f"<b>RSI-{feature['period']}</b>: %{{y:.2f}}<extra></extra>"
+            ), row=rsi_row, col=1)
+
+            # Add reference lines at 30 and 70
+            fig.add_hline(y=70, line_dash="dash", line_color="red", opacity=0.5, row=rsi_row, col=1)
+            fig.add_hline(y=30, line_dash="dash", line_color="green", opacity=0.5, row=rsi_row, col=1)
+
+
+def build_chart(symbol, data, interval_label="1 Day", chart_kind='line',
+                features=None, computed=None, features_sig=None):
+    """Build any of the chart kinds from one shared code path.
+
+    chart_kind is 'line', 'candlestick', 'volume' or 'combined'. The kinds
+    differ only in their primary price trace(s) and row layout; subplot
+    setup, MA/RSI overlays, volume bars and axis styling are shared.
+    """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    if computed is None:
+        computed = compute_features(symbol, data, features)
+
+    if features_sig is None:
+        features_sig = tuple(_feature_key(f) for f in features) if features else ()
 
-def create_combined_chart(symbol, data, interval_label="1 Day", features=None):
-    """Create combined price and volume chart with Plotly."""
-    # Check if RSI features exist
-    has_rsi = any(f['type'] == 'rsi' for f in features) if features else False
+    supports_features = chart_kind != 'volume'
+    has_rsi = bool(supports_features and any(key[0] == 'rsi' for key in features_sig))
+    has_volume_row = chart_kind == 'combined'
 
-    if has_rsi:
-        # 3 subplots: price, volume, RSI
+    # Row layout: price is row 1, volume and RSI follow when present
+    volume_row = 2 if has_volume_row else None
+    rsi_row = (3 if has_volume_row else 2) if has_rsi else None
+
+    price_titles = {
+        'line': f'{symbol} - Closing Price ({interval_label})',
+        'candlestick': f'{symbol} - Candlestick ({interval_label})',
+        'combined': f'{symbol} - Price History ({interval_label} Intervals)',
+    }
+
+    if has_volume_row and has_rsi:
         fig = make_subplots(
             rows=3, cols=1,
             shared_xaxes=True,
             vertical_spacing=0.03,
             row_heights=[0.5, 0.25, 0.25],
             subplot_titles=(
-                f'{symbol} - Price History ({interval_label} Intervals)',
+                price_titles[chart_kind],
                 f'Trading Volume ({interval_label} Bars)',
                 'RSI'
             )
         )
-        volume_row = 2
-        rsi_row = 3
-    else:
-        # 2 subplots: price, volume
+        price_row = 1
+    elif has_volume_row:
         fig = make_subplots(
             rows=2, cols=1,
             shared_xaxes=True,
             vertical_spacing=0.03,
             row_heights=[0.7, 0.3],
             subplot_titles=(
-                f'{symbol} - Price History ({interval_label} Intervals)',
+                price_titles[chart_kind],
                 f'Trading Volume ({interval_label} Bars)'
             )
         )
-        volume_row = 2
-        rsi_row = None
+        price_row = 1
+    elif has_rsi:
+        fig = make_subplots(
+            rows=2, cols=1,
+            shared_xaxes=True,
+            vertical_spacing=0.05,
+            row_heights=[0.7, 0.3],
+            subplot_titles=(price_titles[chart_kind], 'RSI')
+        )
+        price_row = 1
+    else:
+        fig = go.Figure()
+        price_row = None
 
-    # Price chart with high/low range
-    fig.add_trace(go.Scatter(
-        x=data.index,
-        y=data['High'],
-        fill=None,
-        mode='lines',
-        line_color='rgba(162, 59, 114, 0)',
-        showlegend=False,
-        hoverinfo='skip'
-    ), row=1, col=1)
-
-    fig.add_trace(go.Scatter(
-        x=data.index,
-        y=data['Low'],
-        fill='tonexty',
-        mode='lines',
-        line_color='rgba(162, 59, 114, 0)',
-        fillcolor='rgba(162, 59, 114, 0.2)',
-        name='High/Low Range',
-        hoverinfo='skip'
-    ), row=1, col=1)
-
-    fig.add_trace(go.Scatter(
-        x=data.index,
-        y=data['Close'],
-        mode='lines',
-        name='Close',
-        line=dict(color='#2E86AB', width=2),
-        hovertemplate='<b>Close</b>: $%{y:.2f}<extra></extra>'
-    ), row=1, col=1)
-
-    fig.add_trace(go.Scatter(
-        x=data.index,
-        y=data['Open'],
-        mode='lines',
-        name='Open',
-        line=dict(color='#F77F00', width=1),
-        opacity=0.7,
-        hovertemplate='<b>Open</b>: $%{y:.2f}<extra></extra>'
-    ), row=1, col=1)
-
-    # Add features
-    if features:
-        colors = ['#FF6B35', '#4ECDC4', '#FFE66D', '#FF6B9D']
-        ma_idx = 0
-        for feature in features:
-            if feature['type'] == 'moving_average':
-                ma = calculate_moving_average(data, feature['period'], feature['ma_type'])
-                color = colors[ma_idx % len(colors)]
-                ma_idx += 1
-                fig.add_trace(go.Scatter(
-                    x=data.index,
-                    y=ma,
-                    mode='lines',
-                    name=f"{feature['ma_type']}-{feature['period']}",
-                    line=dict(color=color, width=2),
-                    hovertemplate=f"<b>{feature['ma_type']}-{feature['period']}</b>: $%{{y:.2f}}<extra></extra>"
-                ), row=1, col=1)
-            elif feature['type'] == 'rsi':
-                rsi = calculate_rsi(data, feature['period'])
-                fig.add_trace(go.Scatter(
-                    x=data.index,
-                    y=rsi,
-                    mode='lines',
-                    name=f"RSI-{feature['period']}",
-                    line=dict(color='#9B59B6', width=2),
-                    hovertemplate=f"<b>RSI-{feature['period']}</b>: %{{y:.2f}}<extra></extra>"
-                ), row=rsi_row, col=1)
-
-                # Add reference lines at 30 and 70
-                fig.add_hline(y=70, line_dash="dash", line_color="red", opacity=0.5, row=rsi_row, col=1)
-                fig.add_hline(y=30, line_dash="dash", line_color="green", opacity=0.5, row=rsi_row, col=1)
-
-    # Volume chart
-    vol_colors = ['#06A77D' if data['Close'].iloc[i] >= data['Open'].iloc[i] else '#D62828'
-                  for i in range(len(data))]
-
-    fig.add_trace(go.Bar(
-        x=data.index,
-        y=data['Volume'],
-        marker_color=vol_colors,
-        opacity=0.7,
-        name='Volume',
-        hovertemplate='<b>Volume</b>: %{y:,.0f}<extra></extra>'
-    ), row=volume_row, col=1)
-
-    # Update axes
-    fig.update_xaxes(title_text='Date', row=rsi_row if has_rsi else volume_row, col=1)
-    fig.update_yaxes(title_text='Price ($)', row=1, col=1)
-    fig.update_yaxes(title_text='Volume', row=volume_row, col=1)
-    if has_rsi:
+    if chart_kind == 'volume':
+        fig.add_trace(_volume_bar_trace(data, with_date=True))
+    else:
+        _add_price_traces(fig, chart_kind, data, price_row)
+        if features:
+            _add_features(fig, data, features, computed, price_row, rsi_row)
+    if has_volume_row:
+        fig.add_trace(_volume_bar_trace(data), row=volume_row, col=1)
+
+    # Layout and axis titles per kind
+    if has_volume_row:
+        fig.update_xaxes(title_text='Date', row=rsi_row if has_rsi else volume_row, col=1)
+        fig.update_yaxes(title_text='Price ($)', row=1, col=1)
+        fig.update_yaxes(title_text='Volume', row=volume_row, col=1)
+        if has_rsi:
+            fig.update_yaxes(title_text='RSI', range=[0, 100], row=rsi_row, col=1)
+        fig.update_layout(
+            height=800 if has_rsi else 700,
+            hovermode='x unified',
+            template='plotly_white',
+            showlegend=True
+        )
+    elif has_rsi:
+        fig.update_xaxes(title_text='Date', row=rsi_row, col=1)
+        fig.update_yaxes(title_text='Price ($)', row=1, col=1)
         fig.update_yaxes(title_text='RSI', range=[0, 100], row=rsi_row, col=1)
-
-    fig.update_layout(
-        height=800 if has_rsi else 700,
-        hovermode='x unified',
-        template='plotly_white',
-        showlegend=True
-    )
+        fig.update_layout(
+            hovermode='x unified',
+            template='plotly_white',
+            height=700,
+            showlegend=True
+        )
+    else:
+        standalone_titles = {
+            'line': f'{symbol} - Closing Price History ({interval_label} Intervals)',
+            'candlestick': f'{symbol} - Candlestick Chart ({interval_label} Candles)',
+            'volume': f'{symbol} - Trading Volume ({interval_label} Bars)',
+        }
+        layout = dict(
+            title=standalone_titles[chart_kind],
+            xaxis_title='Date',
+            yaxis_title='Price ($)' if chart_kind != 'volume' else 'Volume',
+            template='plotly_white',
+            height=600
+        )
+        if chart_kind == 'line':
+            layout['hovermode'] = 'x unified'
+        fig.update_layout(**layout)
 
     return fig
 
 
+@st.cache_resource(ttl=300)
+def _cached_chart(sig, symbol, interval_label, chart_kind, _data, _features, _computed,
+                  _features_sig):
+    """Figure cache keyed on the chart signature.
+
+    Reruns that don't change the data, chart kind or feature settings reuse
+    the constructed Figure, skipping both build time and Plotly JSON
+    re-serialization.
+    """
+    return build_chart(symbol, _data, interval_label, chart_kind, _features, _computed,
+                       features_sig=_features_sig)
+
+
 # Main content area
 if st.sidebar.button("🔄 Fetch Data", type="primary"):
     st.session_state['fetch_data'] = True
@@ -695,6 +947,10 @@ if 'fetch_data' not in st.session_state:
 if st.session_state.get('fetch_data', False):
     with st.spinner(f'Fetching data for {symbol}...'):
         data = fetch_stock_data(symbol, start_date, end_date, interval)
+        # cache_resource returns a shared object; copy so chart/summary code
+        # can't mutate the cached frame
+        if data is not None:
+            data = data.copy()
 
     if data is not None and not data.empty:
         # Display summary statistics
@@ -702,17 +958,26 @@ if st.session_state.get('fetch_data', False):
             display_summary_stats(symbol, data)
             st.divider()
 
+        # Build the feature list and its signature once per rerun; everything
+        # downstream (feature compute, chart cache, builder) keys off these
+        features = st.session_state['features']
+        features_sig = tuple(_feature_key(f) for f in features)
+
+        # Compute every feature once; the chart builders plot from this dict
+        computed_features = compute_features(symbol, data, features)
+
         # Create and display the selected chart
         st.subheader("📊 Interactive Chart")
 
-        if chart_type == "Line Chart":
-            fig = create_line_chart(symbol, data, interval_choice, st.session_state['features'])
-        elif chart_type == "Candlestick Chart":
-            fig = create_candlestick_chart(symbol, data, interval_choice, st.session_state['features'])
-        elif chart_type == "Volume Chart":
-            fig = create_volume_chart(symbol, data, interval_choice)
-        else:  # Combined Chart
-            fig = create_combined_chart(symbol, data, interval_choice, st.session_state['features'])
+        chart_kind = {
+            "Line Chart": 'line',
+            "Candlestick Chart": 'candlestick',
+            "Volume Chart": 'volume',
+            "Combined Chart": 'combined',
+        }[chart_type]
+        chart_sig = (_data_fingerprint(symbol, data), interval_choice, chart_kind, features_sig)
+        fig = _cached_chart(chart_sig, symbol, interval_choice, chart_kind,
+                            data, features, computed_features, features_sig)
 
         # Display the chart
         st.plotly_chart(fig, use_container_width=True)
@@ -726,10 +991,10 @@ if st.session_state.get('fetch_data', False):
 
         # Download data option
         with st.expander("📥 Download Data"):
-            csv = data.to_csv()
+            csv_bytes = _to_csv_bytes(_data_fingerprint(symbol, data), data)
             st.download_button(
                 label="Download CSV",
-                data=csv,
+                data=csv_bytes,
                 file_name=f"{symbol}_{start_date.strftime('%Y%m%d')}_{end_date.strftime('%Y%m%d')}.csv",
                 mime="text/csv"
             )
@@ -6,7 +6,7 @@ This script downloads historical stock data for all publicly traded companies
 on the NASDAQ and NYSE exchanges and saves them as CSV files.
 
 Features:
-- Downloads ticker lists from NASDAQ FTP
+- Downloads ticker lists from NASDAQ Trader
 - Fetches historical data using yfinance
 - Saves data to organized directory structure
 - Handles errors and retries
@@ -16,13 +16,21 @@ Features:
 
 import yfinance as yf
 import pandas as pd
-import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession
 from datetime import datetime, timedelta
+import io
 import os
+import random
 import time
 import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 import argparse
+import atexit
 import sys
 
 # Configure logging
@@ -36,18 +44,145 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Yahoo's chart endpoint happily serves multiple symbols per request, so
+# tickers are downloaded in batches of this size via yf.download instead of
+# one HTTP round-trip per symbol
+BATCH_SIZE = 20
+
+# Serializes appends to the progress file when batches run on worker threads
+_progress_lock = threading.Lock()
+
+# Completed tickers are buffered here and appended to the progress file in
+# blocks, instead of one open/write/close cycle per ticker
+_pending_progress = []
+_PROGRESS_FLUSH_EVERY = 100
+
+
+# Symbol directory files change at most daily, so both cache layers below
+# (HTTP responses and parsed Parquet copies) live here with a one-day TTL
+_TICKER_CACHE_DIR = Path.home() / '.cache' / 'phinneas'
+_TICKER_CACHE_TTL = 86400
+
+
+def _build_session(expire_after=_TICKER_CACHE_TTL):
+    """Build the HTTP session used for NASDAQ Trader directory fetches.
+
+    Keeps the TLS connection alive across the two directory downloads
+    and caches their responses in SQLite under ~/.cache/phinneas, so
+    repeat runs within the TTL skip the network without littering the
+    working directory. yfinance is deliberately not given this session:
+    it rejects caching sessions and manages connection reuse and its own
+    response cache internally.
+
+    Args:
+        expire_after (int): Cached response lifetime in seconds
+    """
+    _TICKER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    session = CachedSession(str(_TICKER_CACHE_DIR / 'nasdaqtrader.cache'),
+                            backend='sqlite', expire_after=expire_after)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Shared by the (up to two) concurrent ticker-list fetches
+_SESSION = _build_session()
+
+
+class TokenBucket:
+    """
+    Global token-bucket rate limiter shared by all download threads.
+
+    A blanket per-batch sleep stops throttling once batches run in
+    parallel (every worker sleeps at the same time); the bucket enforces
+    one global request rate regardless of how many threads are in flight,
+    while still allowing short bursts up to its capacity.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate            # tokens refilled per second
+        self.capacity = capacity    # maximum burst size
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        """Block until the requested tokens are available, then consume them."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity,
+                                  self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# Installed by download_all_stocks from the --delay setting; None means
+# unthrottled (e.g. when the module is used as a library)
+_rate_limiter = None
+
+
+def _throttle(tokens=1):
+    """Take tokens from the global limiter if one is installed.
+
+    Callers charge one token per upstream HTTP request they are about to
+    trigger, so a 20-ticker batch (which yf.download fans out as 20
+    requests internally) costs 20 tokens, not one.
+    """
+    if _rate_limiter is not None:
+        _rate_limiter.acquire(tokens)
+
+
+def _fetch_symbol_directory(filename):
+    """
+    Fetch a NASDAQ Trader symbol directory file as a DataFrame.
+
+    Uses HTTPS through the shared session (one TLS connection, gzip on
+    the wire) instead of FTP's control+data channel pair, and keeps a
+    best-effort Parquet copy under ~/.cache/phinneas for a day.
+
+    Args:
+        filename (str): Directory file name, e.g. 'nasdaqlisted.txt'
+
+    Returns:
+        pandas.DataFrame: Parsed pipe-separated directory contents
+    """
+    cache_file = _TICKER_CACHE_DIR / f"{filename}.parquet"
+    try:
+        if cache_file.exists() and time.time() - cache_file.stat().st_mtime < _TICKER_CACHE_TTL:
+            return pd.read_parquet(cache_file)
+    except Exception:
+        pass  # unreadable cache entries just mean a re-fetch
+
+    url = f"https://www.nasdaqtrader.com/dynamic/SymbolDirectory/{filename}"
+    resp = _SESSION.get(url, headers={'Accept-Encoding': 'gzip'}, timeout=30)
+    resp.raise_for_status()
+    df = pd.read_csv(io.StringIO(resp.text), sep='|')
+
+    try:
+        _TICKER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(cache_file)
+    except Exception:
+        pass  # the cache is an optimization, never a hard failure
+
+    return df
+
 
 def get_nasdaq_tickers():
     """
-    Fetch list of NASDAQ tickers from NASDAQ FTP.
+    Fetch list of NASDAQ tickers from NASDAQ Trader.
 
     Returns:
         list: List of ticker symbols
     """
     try:
         logger.info("Fetching NASDAQ ticker list...")
-        url = "ftp://ftp.nasdaqtrader.com/SymbolDirectory/nasdaqlisted.txt"
-        df = pd.read_csv(url, sep='|')
+        df = _fetch_symbol_directory('nasdaqlisted.txt')
         # Remove last row (file creation timestamp) and filter test symbols
         df = df[df['Symbol'].notna()]
         df = df[df['Test Issue'] == 'N']
@@ -65,15 +200,14 @@ def get_nasdaq_tickers():
 
 def get_nyse_tickers():
     """
-    Fetch list of NYSE tickers from NASDAQ FTP (includes other exchanges).
+    Fetch list of NYSE tickers from NASDAQ Trader (includes other exchanges).
 
     Returns:
         list: List of ticker symbols
     """
     try:
         logger.info("Fetching NYSE ticker list...")
-        url = "ftp://ftp.nasdaqtrader.com/SymbolDirectory/otherlisted.txt"
-        df = pd.read_csv(url, sep='|')
+        df = _fetch_symbol_directory('otherlisted.txt')
         # Filter for NYSE only
         df = df[df['Exchange'] == 'N']  # N = NYSE
         df = df[df['ACT Symbol'].notna()]
@@ -89,10 +223,20 @@ def get_nyse_tickers():
         return []
 
 
+# Coalesces concurrent identical downloads: the first caller for a
+# (ticker, start, end, interval) key does the network work, later callers
+# block on the same future instead of issuing a duplicate request
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
 def download_stock_data(ticker, start_date, end_date, interval='1d', max_retries=3):
     """
     Download historical data for a single ticker.
 
+    Concurrent calls with the same arguments are coalesced into one
+    upstream request; all callers receive the same result.
+
     Args:
         ticker (str): Stock ticker symbol
         start_date (str): Start date in YYYY-MM-DD format
@@ -103,10 +247,50 @@ def download_stock_data(ticker, start_date, end_date, interval='1d', max_retries
     Returns:
         pandas.DataFrame or None: Historical data or None if failed
     """
+    key = (ticker, str(start_date), str(end_date), interval)
+
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _inflight[key] = future
+
+    if not is_owner:
+        return future.result()
+
+    try:
+        result = _download_stock_data(ticker, start_date, end_date, interval, max_retries)
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def _is_rate_limited(exc):
+    """Best-effort check for a Yahoo 429 buried in an exception chain."""
+    response = getattr(exc, 'response', None)
+    if response is not None and getattr(response, 'status_code', None) == 429:
+        return True
+    message = str(exc)
+    return '429' in message or 'Too Many Requests' in message
+
+
+def _download_stock_data(ticker, start_date, end_date, interval, max_retries):
+    """Fetch one ticker's history from Yahoo, retrying with backoff."""
     for attempt in range(max_retries):
         try:
+            _throttle()
             stock = yf.Ticker(ticker)
-            data = stock.history(start=start_date, end=end_date, interval=interval)
+            # Match the batch path's schema: unadjusted OHLC plus Adj Close,
+            # no dividend/split action columns, so every file in the output
+            # directory has the same columns and price semantics
+            data = stock.history(start=start_date, end=end_date, interval=interval,
+                                 auto_adjust=False, actions=False)
 
             if data.empty:
                 logger.warning(f"{ticker}: No data available")
@@ -116,8 +300,13 @@ def download_stock_data(ticker, start_date, end_date, interval='1d', max_retries
 
         except Exception as e:
             if attempt < max_retries - 1:
-                wait_time = 2 ** attempt  # Exponential backoff
-                logger.warning(f"{ticker}: Attempt {attempt + 1} failed, retrying in {wait_time}s... ({e})")
+                # Exponential backoff with jitter so parallel workers do not
+                # retry in lockstep; rate limiting backs off harder
+                if _is_rate_limited(e):
+                    wait_time = min(60, 2 ** (attempt + 2)) + random.uniform(0, 1.0)
+                else:
+                    wait_time = 2 ** attempt + random.uniform(0, 0.5)
+                logger.warning(f"{ticker}: Attempt {attempt + 1} failed, retrying in {wait_time:.1f}s... ({e})")
                 time.sleep(wait_time)
             else:
                 logger.error(f"{ticker}: Failed after {max_retries} attempts - {e}")
@@ -126,6 +315,69 @@ def download_stock_data(ticker, start_date, end_date, interval='1d', max_retries
     return None
 
 
+def download_stock_batch(tickers, start_date, end_date, interval='1d'):
+    """
+    Download historical data for a batch of tickers in a single request.
+
+    Args:
+        tickers (list): Batch of ticker symbols
+        start_date (str): Start date in YYYY-MM-DD format
+        end_date (str): End date in YYYY-MM-DD format
+        interval (str): Data interval (1d, 1wk, 1mo)
+
+    Returns:
+        dict: Mapping of ticker -> pandas.DataFrame for tickers with data
+    """
+    results = {}
+    try:
+        # yf.download issues one chart request per symbol under the hood
+        _throttle(len(tickers))
+        df = yf.download(
+            tickers=' '.join(tickers),
+            start=start_date,
+            end=end_date,
+            interval=interval,
+            group_by='ticker',
+            threads=True,
+            auto_adjust=False,
+            progress=False
+        )
+    except Exception as e:
+        logger.error(f"Batch download failed for {len(tickers)} tickers - {e}")
+        return results
+
+    if df is None or df.empty:
+        return results
+
+    if not isinstance(df.columns, pd.MultiIndex):
+        # yf.download keeps the (ticker, field) column level even for a
+        # single-ticker batch; a flat frame can only mean one ticker came
+        # back without the level, so hand it over as-is
+        data = df.dropna(how='all')
+        if not data.empty:
+            results[tickers[0]] = data
+        return results
+
+    # Split the MultiIndex frame with a single pass over its columns; the
+    # per-ticker df[ticker] cross-section re-runs an index lookup (and
+    # builds a fresh MultiIndex machinery path) for every symbol
+    column_groups = {}
+    for position, tk in enumerate(df.columns.get_level_values(0)):
+        column_groups.setdefault(tk, []).append(position)
+
+    for ticker in tickers:
+        positions = column_groups.get(ticker)
+        if positions is None:
+            continue
+        data = df.iloc[:, positions]
+        data.columns = data.columns.droplevel(0)
+        data = data.dropna(how='all')
+        if not data.empty:
+            results[ticker] = data
+
+    return results
+
+
 def save_to_csv(ticker, data, output_dir):
     """
     Save stock data to CSV file.
@@ -137,7 +389,10 @@ def save_to_csv(ticker, data, output_dir):
     """
     try:
         filepath = os.path.join(output_dir, f"{ticker}.csv")
-        data.to_csv(filepath)
+        # Arrow's multithreaded C++ writer is several times faster than
+        # pandas to_csv and releases the GIL, so parallel workers overlap
+        table = pa.Table.from_pandas(data.reset_index(), preserve_index=False)
+        pacsv.write_csv(table, filepath)
         logger.debug(f"{ticker}: Saved to {filepath}")
         return True
     except Exception as e:
@@ -145,6 +400,33 @@ def save_to_csv(ticker, data, output_dir):
         return False
 
 
+def save_to_parquet(ticker, data, output_dir):
+    """
+    Save stock data to a compressed Parquet file.
+
+    OHLCV data is numeric and compresses well; Parquet files are several
+    times smaller than the CSV equivalent and an order of magnitude
+    faster to read back into pandas.
+
+    Args:
+        ticker (str): Stock ticker symbol
+        data (pandas.DataFrame): Historical data
+        output_dir (str): Output directory path
+    """
+    try:
+        filepath = os.path.join(output_dir, f"{ticker}.parquet")
+        data.to_parquet(filepath, compression='snappy', engine='pyarrow')
+        logger.debug(f"{ticker}: Saved to {filepath}")
+        return True
+    except Exception as e:
+        logger.error(f"{ticker}: Error saving to Parquet - {e}")
+        return False
+
+
+# Writer for each supported --format value
+_SAVERS = {'csv': save_to_csv, 'parquet': save_to_parquet}
+
+
 def load_progress(progress_file):
     """
     Load download progress from file.
@@ -156,21 +438,88 @@ def load_progress(progress_file):
         set: Set of already downloaded tickers
     """
     if os.path.exists(progress_file):
-        with open(progress_file, 'r') as f:
-            return set(line.strip() for line in f)
+        # One bulk read + C-level splitlines instead of a Python-level
+        # strip per line; the file is one ticker per line so no other
+        # whitespace handling is needed
+        with open(progress_file, 'rb') as f:
+            raw = f.read()
+        return set(raw.decode('utf-8').splitlines())
     return set()
 
 
+def flush_progress(progress_file):
+    """
+    Append all buffered tickers to the progress file.
+
+    Args:
+        progress_file (str): Path to progress file
+    """
+    with _progress_lock:
+        if _pending_progress:
+            with open(progress_file, 'a') as f:
+                f.write('\n'.join(_pending_progress) + '\n')
+            _pending_progress.clear()
+
+
 def save_progress(ticker, progress_file):
     """
-    Save download progress to file.
+    Record a completed ticker, flushing to disk every few hundred entries.
 
     Args:
         ticker (str): Ticker that was successfully downloaded
         progress_file (str): Path to progress file
     """
-    with open(progress_file, 'a') as f:
-        f.write(f"{ticker}\n")
+    with _progress_lock:
+        _pending_progress.append(ticker)
+        should_flush = len(_pending_progress) >= _PROGRESS_FLUSH_EVERY
+
+    if should_flush:
+        flush_progress(progress_file)
+
+
+def process_batch(batch, start_date, end_date, interval, output_dir, progress_file,
+                  output_format='csv'):
+    """
+    Download, save, and record progress for one batch of tickers.
+
+    Runs on a worker thread; returns per-batch counts so the caller can
+    aggregate statistics without shared mutable state.
+
+    Args:
+        batch (list): Batch of ticker symbols
+        start_date (str): Start date in YYYY-MM-DD format
+        end_date (str): End date in YYYY-MM-DD format
+        interval (str): Data interval (1d, 1wk, 1mo)
+        output_dir (str): Directory to save CSV files
+        progress_file (str): Path to progress file
+        output_format (str): Output file format ('csv' or 'parquet')
+
+    Returns:
+        tuple: (success_count, failed_count)
+    """
+    success = 0
+    failed = 0
+    save_data = _SAVERS[output_format]
+
+    batch_data = download_stock_batch(batch, start_date, end_date, interval)
+
+    for ticker in batch:
+        data = batch_data.get(ticker)
+
+        # Fall back to a per-ticker retry for symbols missing from the batch
+        if data is None:
+            data = download_stock_data(ticker, start_date, end_date, interval)
+
+        if data is not None and not data.empty:
+            if save_data(ticker, data, output_dir):
+                success += 1
+                save_progress(ticker, progress_file)
+            else:
+                failed += 1
+        else:
+            failed += 1
+
+    return success, failed
 
 
 def download_all_stocks(exchanges=['NASDAQ', 'NYSE'],
@@ -179,7 +528,9 @@ def download_all_stocks(exchanges=['NASDAQ', 'NYSE'],
                         end_date=None,
                         interval='1d',
                         delay=0.5,
-                        resume=True):
+                        resume=True,
+                        workers=8,
+                        output_format='csv'):
     """
     Download historical data for all stocks in specified exchanges.
 
@@ -191,6 +542,8 @@ def download_all_stocks(exchanges=['NASDAQ', 'NYSE'],
         interval (str): Data interval (1d, 1wk, 1mo)
         delay (float): Delay between requests in seconds
         resume (bool): Resume from previous download
+        workers (int): Number of concurrent download threads
+        output_format (str): Output file format ('csv' or 'parquet')
     """
     # Set default dates
     if end_date is None:
@@ -198,6 +551,11 @@ def download_all_stocks(exchanges=['NASDAQ', 'NYSE'],
     if start_date is None:
         start_date = (datetime.now() - timedelta(days=5*365)).strftime('%Y-%m-%d')
 
+    # Parse the date window once; passing datetime objects to yfinance
+    # means it does not re-parse the same strings for every batch
+    start_dt = pd.Timestamp(start_date).to_pydatetime()
+    end_dt = pd.Timestamp(end_date).to_pydatetime()
+
     logger.info(f"Download Configuration:")
     logger.info(f"  Exchanges: {', '.join(exchanges)}")
     logger.info(f"  Date Range: {start_date} to {end_date}")
@@ -208,15 +566,16 @@ def download_all_stocks(exchanges=['NASDAQ', 'NYSE'],
     # Create output directory
     Path(output_dir).mkdir(parents=True, exist_ok=True)
 
-    # Get tickers for each exchange
+    # Get tickers for each exchange; the two directory fetches are
+    # independent network calls, so run them concurrently and join in a
+    # fixed order to keep the combined list deterministic
+    _fetchers = [('NASDAQ', get_nasdaq_tickers), ('NYSE', get_nyse_tickers)]
     all_tickers = []
-    if 'NASDAQ' in exchanges:
-        nasdaq_tickers = get_nasdaq_tickers()
-        all_tickers.extend(nasdaq_tickers)
-
-    if 'NYSE' in exchanges:
-        nyse_tickers = get_nyse_tickers()
-        all_tickers.extend(nyse_tickers)
+    with ThreadPoolExecutor(max_workers=2) as list_executor:
+        list_futures = [list_executor.submit(fetch)
+                        for exchange, fetch in _fetchers if exchange in exchanges]
+        for future in list_futures:
+            all_tickers.extend(future.result())
 
     # Remove duplicates while preserving order
     all_tickers = list(dict.fromkeys(all_tickers))
@@ -234,6 +593,17 @@ def download_all_stocks(exchanges=['NASDAQ', 'NYSE'],
     if completed_tickers:
         logger.info(f"Resuming download: {len(completed_tickers)} already completed")
 
+    # Guarantee buffered progress reaches disk even on interrupt, so a
+    # resumed run does not re-download already-finished tickers
+    atexit.register(flush_progress, progress_file)
+
+    # Install the global rate limiter: --delay is the average spacing between
+    # upstream requests, so the refill rate is its inverse; capacity must
+    # cover at least one full batch (one token per symbol) to avoid stalling
+    global _rate_limiter
+    _rate_limiter = TokenBucket(rate=1.0 / delay,
+                                capacity=max(workers, BATCH_SIZE)) if delay > 0 else None
+
     # Statistics
     stats = {
         'total': len(all_tickers),
@@ -243,39 +613,50 @@ def download_all_stocks(exchanges=['NASDAQ', 'NYSE'],
         'skipped': 0
     }
 
-    # Download data
+    # Filter out completed tickers up front so batches only contain real work
+    pending_tickers = [t for t in all_tickers if t not in completed_tickers]
+    stats['skipped'] = len(all_tickers) - len(pending_tickers)
+
+    # Download batches of BATCH_SIZE tickers on a bounded thread pool; the
+    # workload is I/O-bound, so a handful of threads overlap the network
+    # round-trips without tripping Yahoo's rate limiter
+    batches = [pending_tickers[i:i + BATCH_SIZE]
+               for i in range(0, len(pending_tickers), BATCH_SIZE)]
+
     start_time = time.time()
+    processed = 0
 
-    for idx, ticker in enumerate(all_tickers, 1):
-        # Skip if already completed
-        if ticker in completed_tickers:
-            stats['skipped'] += 1
-            continue
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(process_batch, batch, start_dt, end_dt,
+                            interval, output_dir, progress_file, output_format): batch
+            for batch in batches
+        }
 
-        # Progress update
-        progress_pct = (idx / stats['total']) * 100
-        elapsed = time.time() - start_time
-        rate = idx / elapsed if elapsed > 0 else 0
-        eta = (stats['total'] - idx) / rate if rate > 0 else 0
+        for future in as_completed(futures):
+            batch = futures[future]
 
-        logger.info(f"[{idx}/{stats['total']} - {progress_pct:.1f}%] Downloading {ticker}... "
-                   f"(ETA: {eta/60:.1f}m, Rate: {rate:.1f} tickers/s)")
+            try:
+                success, failed = future.result()
+            except Exception as e:
+                logger.error(f"Batch of {len(batch)} tickers failed - {e}")
+                success, failed = 0, len(batch)
 
-        # Download data
-        data = download_stock_data(ticker, start_date, end_date, interval)
+            stats['success'] += success
+            stats['failed'] += failed
 
-        if data is not None and not data.empty:
-            # Save to CSV
-            if save_to_csv(ticker, data, output_dir):
-                stats['success'] += 1
-                save_progress(ticker, progress_file)
-            else:
-                stats['failed'] += 1
-        else:
-            stats['failed'] += 1
+            # Progress update
+            processed += len(batch)
+            progress_pct = (processed / len(pending_tickers)) * 100
+            elapsed = time.time() - start_time
+            rate = processed / elapsed if elapsed > 0 else 0
+            eta = (len(pending_tickers) - processed) / rate if rate > 0 else 0
+
+            logger.info(f"[{processed}/{len(pending_tickers)} - {progress_pct:.1f}%] "
+                       f"Finished batch of {len(batch)} "
+                       f"(ETA: {eta/60:.1f}m, Rate: {rate:.1f} tickers/s)")
 
-        # Rate limiting
-        time.sleep(delay)
+    flush_progress(progress_file)
 
     # Final statistics
     total_time = time.time() - start_time
@@ -286,7 +667,9 @@ def download_all_stocks(exchanges=['NASDAQ', 'NYSE'],
     logger.info(f"Successful: {stats['success']}")
     logger.info(f"Failed: {stats['failed']}")
     logger.info(f"Skipped: {stats['skipped']}")
-    logger.info(f"Success Rate: {(stats['success']/(stats['total']-stats['skipped'])*100):.1f}%")
+    attempted = stats['total'] - stats['skipped']
+    if attempted:
+        logger.info(f"Success Rate: {(stats['success']/attempted*100):.1f}%")
     logger.info(f"Output Directory: {os.path.abspath(output_dir)}")
     logger.info("=" * 80)
 
@@ -354,7 +737,23 @@ Examples:
         '--delay',
         type=float,
         default=0.5,
-        help='Delay between requests in seconds (default: 0.5)'
+        help='Average spacing between requests in seconds, enforced globally '
+             'across all workers (default: 0.5; 0 disables throttling)'
+    )
+
+    parser.add_argument(
+        '--format',
+        type=str,
+        choices=['csv', 'parquet'],
+        default='csv',
+        help='Output file format (default: csv; parquet is smaller and faster to re-read)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=8,
+        help='Number of concurrent download threads (default: 8)'
     )
 
     parser.add_argument(
@@ -373,7 +772,9 @@ Examples:
         end_date=args.end,
         interval=args.interval,
         delay=args.delay,
-        resume=not args.no_resume
+        resume=not args.no_resume,
+        workers=args.workers,
+        output_format=args.format
     )
 
 
@@ -5,9 +5,13 @@ An interactive tool to view historical stock pricing data using yfinance.
 """
 
 import yfinance as yf
+import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.patches import Patch
 from datetime import datetime, timedelta
+from functools import lru_cache
 import sys
 
 
@@ -94,13 +98,24 @@ def get_custom_date_range():
     return start_date, end_date
 
 
+@lru_cache(maxsize=64)
+def _fetch_history(symbol, start_iso, end_iso):
+    """Fetch history from yfinance, memoized on (symbol, start, end).
+
+    Re-exploring the same symbol and range in one session becomes a
+    dictionary lookup instead of a network round-trip. Errors propagate
+    so failed fetches are never cached.
+    """
+    ticker = yf.Ticker(symbol)
+    return ticker.history(start=start_iso, end=end_iso)
+
+
 def fetch_stock_data(symbol, start_date, end_date):
     """Fetch historical stock data using yfinance."""
     try:
         print(f"\nFetching data for {symbol}...")
-        ticker = yf.Ticker(symbol)
-        data = ticker.history(start=start_date.strftime("%Y-%m-%d"),
-                            end=end_date.strftime("%Y-%m-%d"))
+        data = _fetch_history(symbol, start_date.strftime("%Y-%m-%d"),
+                              end_date.strftime("%Y-%m-%d"))
 
         if data.empty:
             print(f"Error: No data found for symbol '{symbol}'. Please check the symbol and try again.")
@@ -114,25 +129,35 @@ def fetch_stock_data(symbol, start_date, end_date):
 
 def display_summary(symbol, data):
     """Display summary statistics of the stock data."""
+    # Pull each column out as a plain array once and compute every statistic
+    # from those, instead of a separate pandas reduction per print line
+    close = data['Close'].to_numpy()
+    volume = data['Volume'].to_numpy()
+    first_open = data['Open'].iloc[0]
+    high_max = data['High'].to_numpy().max()
+    low_min = data['Low'].to_numpy().min()
+    first_close, last_close = close[0], close[-1]
+
+    price_change = last_close - first_close
+    percent_change = (price_change / first_close) * 100
+
     print(f"\n{'='*60}")
     print(f"Summary for {symbol}")
     print(f"{'='*60}")
     print(f"Period: {data.index[0].strftime('%Y-%m-%d')} to {data.index[-1].strftime('%Y-%m-%d')}")
     print(f"Trading days: {len(data)}")
     print(f"\nPrice Statistics:")
-    print(f"  Opening Price:  ${data['Open'].iloc[0]:.2f} (first day)")
-    print(f"  Closing Price:  ${data['Close'].iloc[-1]:.2f} (last day)")
-    print(f"  Highest Price:  ${data['High'].max():.2f}")
-    print(f"  Lowest Price:   ${data['Low'].min():.2f}")
-    print(f"  Average Close:  ${data['Close'].mean():.2f}")
-
-    price_change = data['Close'].iloc[-1] - data['Close'].iloc[0]
-    percent_change = (price_change / data['Close'].iloc[0]) * 100
+    print(f"  Opening Price:  ${first_open:.2f} (first day)")
+    print(f"  Closing Price:  ${last_close:.2f} (last day)")
+    print(f"  Highest Price:  ${high_max:.2f}")
+    print(f"  Lowest Price:   ${low_min:.2f}")
+    print(f"  Average Close:  ${close.mean():.2f}")
+
     print(f"\nPrice Change: ${price_change:.2f} ({percent_change:+.2f}%)")
 
     print(f"\nVolume Statistics:")
-    print(f"  Average Volume: {data['Volume'].mean():,.0f}")
-    print(f"  Total Volume:   {data['Volume'].sum():,.0f}")
+    print(f"  Average Volume: {volume.mean():,.0f}")
+    print(f"  Total Volume:   {volume.sum():,.0f}")
     print(f"{'='*60}\n")
 
 
@@ -168,31 +193,49 @@ def plot_line_chart(symbol, data):
 
 
 def plot_candlestick_chart(symbol, data):
-    """Plot a candlestick chart."""
+    """Plot a candlestick chart.
+
+    Bodies are drawn as a single PolyCollection and wicks as a single
+    LineCollection, so the renderer iterates two artists instead of one
+    Rectangle per bar segment.
+    """
     fig, ax = plt.subplots(figsize=(12, 6))
 
     # Calculate width for candlesticks
     width = 0.6
-    width2 = 0.1
-
-    # Colors for up and down days
-    up = data[data['Close'] >= data['Open']]
-    down = data[data['Close'] < data['Open']]
 
-    # Plot up prices
-    ax.bar(up.index, up['Close'] - up['Open'], width, bottom=up['Open'], color='#06A77D', label='Up')
-    ax.bar(up.index, up['High'] - up['Close'], width2, bottom=up['Close'], color='#06A77D')
-    ax.bar(up.index, up['Low'] - up['Open'], width2, bottom=up['Open'], color='#06A77D')
+    x = mdates.date2num(data.index)
+    opens = data['Open'].to_numpy()
+    closes = data['Close'].to_numpy()
+    highs = data['High'].to_numpy()
+    lows = data['Low'].to_numpy()
 
-    # Plot down prices
-    ax.bar(down.index, down['Close'] - down['Open'], width, bottom=down['Open'], color='#D62828', label='Down')
-    ax.bar(down.index, down['High'] - down['Open'], width2, bottom=down['Open'], color='#D62828')
-    ax.bar(down.index, down['Low'] - down['Close'], width2, bottom=down['Close'], color='#D62828')
+    # Colors for up and down days
+    colors = np.where(closes >= opens, '#06A77D', '#D62828')
+
+    # Candle bodies as one quad per bar, wicks as one low-high segment
+    half = width / 2
+    bodies = np.stack([
+        np.column_stack([x - half, opens]),
+        np.column_stack([x - half, closes]),
+        np.column_stack([x + half, closes]),
+        np.column_stack([x + half, opens]),
+    ], axis=1)
+    wicks = np.stack([
+        np.column_stack([x, lows]),
+        np.column_stack([x, highs]),
+    ], axis=1)
+
+    ax.add_collection(LineCollection(wicks, colors=colors, linewidths=1))
+    ax.add_collection(PolyCollection(bodies, facecolors=colors, edgecolors=colors))
+    ax.xaxis_date()
+    ax.autoscale_view()
 
     ax.set_title(f'{symbol} - Candlestick Chart', fontsize=16, fontweight='bold')
     ax.set_xlabel('Date', fontsize=12)
     ax.set_ylabel('Price ($)', fontsize=12)
-    ax.legend()
+    ax.legend(handles=[Patch(color='#06A77D', label='Up'),
+                       Patch(color='#D62828', label='Down')])
     ax.grid(True, alpha=0.3)
     ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
     plt.xticks(rotation=45)
@@ -204,8 +247,9 @@ def plot_volume_chart(symbol, data):
     """Plot volume chart."""
     fig, ax = plt.subplots(figsize=(12, 6))
 
-    colors = ['#06A77D' if data['Close'].iloc[i] >= data['Open'].iloc[i] else '#D62828'
-              for i in range(len(data))]
+    # One vectorized comparison instead of a Python-level .iloc per bar
+    colors = np.where(data['Close'].to_numpy() >= data['Open'].to_numpy(),
+                      '#06A77D', '#D62828')
 
     ax.bar(data.index, data['Volume'], color=colors, alpha=0.7)
     ax.set_title(f'{symbol} - Trading Volume', fontsize=16, fontweight='bold')
@@ -234,8 +278,8 @@ def plot_combined_chart(symbol, data):
     ax1.grid(True, alpha=0.3)
 
     # Volume chart
-    colors = ['#06A77D' if data['Close'].iloc[i] >= data['Open'].iloc[i] else '#D62828'
-              for i in range(len(data))]
+    colors = np.where(data['Close'].to_numpy() >= data['Open'].to_numpy(),
+                      '#06A77D', '#D62828')
     ax2.bar(data.index, data['Volume'], color=colors, alpha=0.7)
     ax2.set_xlabel('Date', fontsize=12)
     ax2.set_ylabel('Volume', fontsize=12)